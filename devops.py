@@ -21,26 +21,40 @@ File: TypeAlias = Union[IO[Any], int, None]
 
 
 def _shell(
-    cmd: str,
+    cmd: Union[str, list],
     check: bool = True,
     stdin: File = None,
     stdout: File = None,
     stderr: File = None,
 ):  # pragma: no cover
-    """Runs a subprocess shell with check=True by default"""
-    return subprocess.run(cmd, shell=True, check=check, stdin=stdin, stdout=stdout, stderr=stderr)
+    """Runs a subprocess with check=True by default.
+
+    String commands run through a shell. List commands are executed
+    directly, avoiding the intermediate shell process when shell
+    features aren't needed.
+    """
+    return subprocess.run(
+        cmd,
+        shell=isinstance(cmd, str),
+        check=check,
+        stdin=stdin,
+        stdout=stdout,
+        stderr=stderr,
+    )
 
 
 def _publish_to_pypi() -> None:
     """
     Uses poetry to publish to pypi
     """
-    if "PYPI_USERNAME" not in os.environ or "PYPI_PASSWORD" not in os.environ:
+    pypi_username = os.environ.get("PYPI_USERNAME")
+    pypi_password = os.environ.get("PYPI_PASSWORD")
+    if not pypi_username or not pypi_password:
         raise RuntimeError("Must set PYPI_USERNAME and PYPI_PASSWORD env vars")
 
-    _shell("poetry config http-basic.pypi ${PYPI_USERNAME} ${PYPI_PASSWORD}")
-    _shell("poetry build")
-    _shell("poetry publish -vvv -n", stdout=subprocess.PIPE)
+    _shell(["poetry", "config", "http-basic.pypi", pypi_username, pypi_password])
+    _shell(["poetry", "build"])
+    _shell(["poetry", "publish", "-vvv", "-n"], stdout=subprocess.PIPE)
 
 
 def deploy() -> None:
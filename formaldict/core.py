@@ -11,9 +11,10 @@ This module contains the `Schema`, the parsed
 """
 
 import collections.abc
-import copy
 import datetime as dt
+import functools
 import re
+import sys
 
 import dateutil.parser
 import kmatch
@@ -24,6 +25,68 @@ from prompt_toolkit.formatted_text import HTML
 
 from . import exceptions
 
+# Shared parser instance so parse_datetime doesn't construct a new
+# dateutil parser on every call
+_datetime_parser = dateutil.parser.parser()
+
+# Unix timestamps for datetime.min and datetime.max in UTC. Timestamps
+# outside this range cannot be represented as datetimes.
+_min_timestamp = -62135596800
+_max_timestamp = 253402300799
+_epoch = dt.datetime(1970, 1, 1)
+
+# Default attributes filled in for every schema entry. String entries
+# have additional defaults for "matches"/"choices" and an empty-string
+# default value. The "name" default is derived from the label and filled
+# in per entry.
+_string_entry_defaults = {
+    "label": "",
+    "condition": None,
+    "required": True,
+    "help": "",
+    "type": "string",
+    "multiline": False,
+    "matches": None,
+    "choices": None,
+    "default": "",
+}
+_non_string_entry_defaults = {
+    "label": "",
+    "condition": None,
+    "required": True,
+    "help": "",
+    "type": "string",
+    "multiline": False,
+    "default": None,
+}
+
+
+def _freeze_condition(condition):
+    """Recursively converts a condition's lists to tuples so it can be hashed"""
+    if isinstance(condition, list):
+        return tuple(_freeze_condition(value) for value in condition)
+    else:
+        return condition
+
+
+def _thaw_condition(condition):
+    """Converts a frozen condition back into the list form kmatch expects"""
+    if isinstance(condition, tuple):
+        return [_thaw_condition(value) for value in condition]
+    else:
+        return condition
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_condition(frozen_condition):
+    """Compiles a frozen condition pattern into a shared kmatch.K.
+
+    Identical conditions are common across schemas (and across repeated
+    construction of the same schema), so compilation is cached on the
+    condition structure.
+    """
+    return kmatch.K(_thaw_condition(frozen_condition), suppress_key_errors=True)
+
 
 class _ValueValidator(prompt_toolkit.validation.Validator):
     """
@@ -51,14 +114,18 @@ class Errors(collections.abc.Mapping):
     Collects errors found when validating a `Schema`
     """
 
+    __slots__ = ("_errors",)
+
     def __init__(self):
-        self._errors = collections.defaultdict(list)
+        self._errors = {}
 
     def add(self, exc, label="__all__"):
-        self._errors[label].append(exc)
+        self._errors.setdefault(label, []).append(exc)
 
     def __getitem__(self, label):
-        return self._errors[label]
+        # Labels without errors return an empty list, as they did when
+        # the errors were stored in a defaultdict
+        return self._errors.get(label, [])
 
     def __len__(self):
         return len(self._errors)
@@ -67,16 +134,14 @@ class Errors(collections.abc.Mapping):
         return iter(self._errors)
 
     def __str__(self):
-        return (
-            " ".join(str(error) for error in self._errors["__all__"])
-            + " "
-            + " ".join(
-                f"{label}: {error}"
-                for label, errors in self._errors.items()
-                if label != "__all__"
-                for error in errors
-            )
-        ).strip()
+        parts = [str(error) for error in self._errors.get("__all__", [])]
+        parts.extend(
+            f"{label}: {error}"
+            for label, errors in self._errors.items()
+            if label != "__all__"
+            for error in errors
+        )
+        return " ".join(parts)
 
 
 class FormalDict(collections.abc.Mapping):
@@ -92,6 +157,8 @@ class FormalDict(collections.abc.Mapping):
     attributes on the dictionary.
     """
 
+    __slots__ = ("_schema", "_data", "_parsed", "_errors", "_is_valid")
+
     def __init__(self, *, schema, parsed, data, errors):
         assert isinstance(parsed, dict)
         assert isinstance(schema, Schema)
@@ -101,6 +168,7 @@ class FormalDict(collections.abc.Mapping):
         self._data = data
         self._parsed = parsed
         self._errors = errors
+        self._is_valid = not errors
 
     def __getitem__(self, label):
         return self._parsed[label]
@@ -111,6 +179,21 @@ class FormalDict(collections.abc.Mapping):
     def __iter__(self):
         return iter(self._parsed)
 
+    def __eq__(self, other):
+        """
+        Compares the parsed data against other mappings directly instead
+        of going through the Mapping mixin, which materializes both sides
+        into new dicts
+        """
+        if isinstance(other, FormalDict):
+            return self._parsed == other._parsed
+        elif isinstance(other, dict):
+            return self._parsed == other
+        elif isinstance(other, collections.abc.Mapping):
+            return self._parsed == dict(other)
+        else:
+            return NotImplemented
+
     @property
     def data(self):
         """The raw data used when constructing the formal dictionary"""
@@ -137,7 +220,7 @@ class FormalDict(collections.abc.Mapping):
         True if the dictionary is valid and all attributes are present
         from the schema
         """
-        return not self.errors
+        return self._is_valid
 
 
 class Schema(collections.abc.Sequence):
@@ -292,6 +375,20 @@ class Schema(collections.abc.Sequence):
             })
     """
 
+    __slots__ = (
+        "_raw_schema",
+        "_schema",
+        "_entry_schemas",
+        "_compiled_matches",
+        "_condition_matchers",
+        "_entry_parsers",
+        "_choice_sets",
+        "_help_texts",
+        "_prompt_texts",
+        "_validators",
+        "_labels",
+    )
+
     def __init__(self, schema):
         """
         Initialize the schema object
@@ -301,8 +398,10 @@ class Schema(collections.abc.Sequence):
         """
         assert isinstance(schema, (list, tuple))
 
-        # Keep a copy of the original raw schema given by the user
-        self._raw_schema = copy.deepcopy(schema)
+        # Keep a copy of the original raw schema given by the user. Entries
+        # are flat dicts whose values are never mutated in place, so a
+        # shallow per-entry copy is enough to isolate us from the caller.
+        self._raw_schema = [dict(entry_schema) for entry_schema in schema]
 
         # Instantiate the cleaned schema (i.e. self._schema)
         self._clean()
@@ -329,38 +428,59 @@ class Schema(collections.abc.Sequence):
         """
         schema_with_defaults = []
         for entry_schema in self._schema:
-            default_entry_schema = {
-                "label": "",
-                "condition": None,
-                "required": True,
-                "name": (entry_schema.get("label", "").replace("_", " ").title()),
-                "help": "",
-                "type": "string",
-                "multiline": False,
-            }
-
-            if entry_schema.get("type", "string") == "string":
-                default_entry_schema = {
-                    **{"matches": None, "choices": None, "default": ""},
-                    **default_entry_schema,
-                }
-            else:
-                default_entry_schema = {
-                    **{"default": None},
-                    **default_entry_schema,
-                }
+            default_entry_schema = (
+                _string_entry_defaults
+                if entry_schema.get("type", "string") == "string"
+                else _non_string_entry_defaults
+            )
+
+            entry_schema = {**default_entry_schema, **entry_schema}
+            if "name" not in entry_schema:
+                entry_schema["name"] = entry_schema["label"].replace("_", " ").title()
 
-            schema_with_defaults.append({**default_entry_schema, **entry_schema})
+            schema_with_defaults.append(entry_schema)
 
         self._schema = schema_with_defaults
 
     def _clean(self):
         """Cleans the schema and ensures it is valid"""
-        self._schema = copy.deepcopy(self._raw_schema)
+        self._schema = [dict(entry_schema) for entry_schema in self._raw_schema]
         self._entry_schemas = {}
 
+        # Compiled "matches" patterns, keyed by label. Stored separately
+        # from the entry schemas so that the cleaned schema only contains
+        # the user-facing attributes.
+        self._compiled_matches = {}
+
+        # Bound condition matchers, keyed by label. Entries without a
+        # condition map to None so that parse/prompt can skip condition
+        # evaluation without re-inspecting the condition type.
+        self._condition_matchers = {}
+
+        # Type parsers, keyed by label. Unsupported types map to None
+        # and raise a ValidationError when parsed, preserving the
+        # behavior of lazily validating the schema type.
+        self._entry_parsers = {}
+
+        # Frozensets of valid choices, keyed by label, for O(1)
+        # membership checks. The original choice lists stay on the
+        # entries for ordering, error messages, and help text.
+        self._choice_sets = {}
+
+        # Help and prompt texts, keyed by label. These are deterministic
+        # functions of the entry schema, so they are rendered once here
+        # instead of on every prompt.
+        self._help_texts = {}
+        self._prompt_texts = {}
+
+        # Prompt validators, keyed by label. Validators only reference
+        # the schema and the label, so one per entry can be reused
+        # across prompts.
+        self._validators = {}
+
         self._fill_defaults()
 
+        type_parsers = {"string": self.parse_string, "datetime": self.parse_datetime}
         for entry_schema in self:
             label = entry_schema.get("label")
 
@@ -370,6 +490,15 @@ class Schema(collections.abc.Sequence):
             if label in self._entry_schemas:
                 raise ValueError(f'Multiple declarations for label "{label}" in schema')
 
+            # Intern the label and type so that the frequent dict lookups
+            # and equality checks against them short-circuit on identity.
+            # Non-string types are left as-is so that they keep raising a
+            # ValidationError when parsed.
+            if isinstance(label, str):  # pragma: no branch
+                label = entry_schema["label"] = sys.intern(label)
+            if isinstance(entry_schema["type"], str):
+                entry_schema["type"] = sys.intern(entry_schema["type"])
+
             if (
                 entry_schema["type"] == "string"
                 and entry_schema["matches"]
@@ -377,8 +506,22 @@ class Schema(collections.abc.Sequence):
             ):
                 raise ValueError('Cannot have both "matches" and "choices" for a string')
 
+            if entry_schema["type"] == "string" and entry_schema["matches"]:
+                self._compiled_matches[label] = re.compile(entry_schema["matches"])
+
+            if entry_schema["type"] == "string" and entry_schema["choices"]:
+                self._choice_sets[label] = frozenset(entry_schema["choices"])
+
+            self._help_texts[label] = self._build_help_text(entry_schema)
+            self._prompt_texts[label] = self._build_prompt_text(entry_schema)
+            self._validators[label] = _ValueValidator(schema=self, label=label)
+
             if entry_schema["condition"] is not None:
-                condition = kmatch.K(entry_schema["condition"], suppress_key_errors=True)
+                try:
+                    condition = _compile_condition(_freeze_condition(entry_schema["condition"]))
+                except TypeError:
+                    # Conditions with unhashable values cannot be cached
+                    condition = kmatch.K(entry_schema["condition"], suppress_key_errors=True)
                 for condition_label in condition.get_field_keys():
                     if condition_label not in self._entry_schemas:
                         raise ValueError(
@@ -390,21 +533,32 @@ class Schema(collections.abc.Sequence):
 
                 entry_schema["condition"] = condition
 
+            self._condition_matchers[label] = (
+                entry_schema["condition"].match if entry_schema["condition"] is not None else None
+            )
+
+            self._entry_parsers[label] = type_parsers.get(entry_schema["type"])
+
             # Keep a running list of entries that have been seen. This
             # helps us validate if conditions only reference previous steps
             self._entry_schemas[label] = entry_schema
 
+        # Frozen view of every label in the schema, used for the
+        # strict-mode "extra labels" check
+        self._labels = frozenset(self._entry_schemas)
+
     def parse_string(self, label, value):
+        entry_schema = self._entry_schemas[label]
         value = str(value)
 
-        if self[label]["matches"] and not re.fullmatch(self[label]["matches"], value):
+        if entry_schema["matches"] and not self._compiled_matches[label].fullmatch(value):
             raise exceptions.ValidationError(
-                f'Value "{value}" does not match' f' pattern "{self[label]["matches"]}".'
+                f'Value "{value}" does not match' f' pattern "{entry_schema["matches"]}".'
             )
-        elif self[label]["choices"] and value not in self[label]["choices"]:
+        elif entry_schema["choices"] and value not in self._choice_sets[label]:
             raise exceptions.ValidationError(
                 f'Value "{value}" not a valid'
-                f' choice. Possible choices: "{self[label]["choices"]}".'
+                f' choice. Possible choices: "{entry_schema["choices"]}".'
             )
 
         return value
@@ -412,19 +566,28 @@ class Schema(collections.abc.Sequence):
     def parse_datetime(self, label, value):
         if not isinstance(value, dt.datetime):
             if isinstance(value, int):
-                try:
-                    value = dt.datetime.utcfromtimestamp(value)
-                except Exception as exc:
-                    raise exceptions.ValidationError(
-                        f'Cannot parse datetime integer "{value}"'
-                    ) from exc
+                if not _min_timestamp <= value <= _max_timestamp:
+                    raise exceptions.ValidationError(f'Cannot parse datetime integer "{value}"')
+
+                # Convert with pure arithmetic, matching the naive UTC
+                # datetimes of the deprecated utcfromtimestamp. Unlike
+                # fromtimestamp, this cannot fail platform-dependently
+                # (e.g. Windows rejects all pre-epoch timestamps) for
+                # values inside the checked range.
+                value = _epoch + dt.timedelta(seconds=value)
             elif isinstance(value, str):
                 try:
-                    value = dateutil.parser.parse(value)
-                except dateutil.parser.ParserError as exc:
-                    raise exceptions.ValidationError(
-                        f'Cannot automatically parse datetime string "{value}"'
-                    ) from exc
+                    # fromisoformat is a C-implemented fast path for the
+                    # common ISO-8601 formats. Fall back to dateutil's
+                    # flexible parsing for everything else.
+                    value = dt.datetime.fromisoformat(value)
+                except ValueError:
+                    try:
+                        value = _datetime_parser.parse(value)
+                    except dateutil.parser.ParserError as exc:
+                        raise exceptions.ValidationError(
+                            f'Cannot automatically parse datetime string "{value}"'
+                        ) from exc
             else:
                 raise exceptions.ValidationError(
                     f'Cannot parse type "{type(value)}" into datetime'
@@ -437,25 +600,26 @@ class Schema(collections.abc.Sequence):
         Parse the value based on the schema. Raise a ValidationError if any
         validation error occurs.
         """
+        entry_schema = self._entry_schemas[label]
+
         if isinstance(value, str):
             value = value.strip()
 
         if not value:
-            value = self[label]["default"]
+            value = entry_schema["default"]
 
-        if self[label]["required"] and not value:
+        if entry_schema["required"] and not value:
             raise exceptions.ValidationError("This field is required.")
-        elif not self[label]["required"] and not value:
+        elif not entry_schema["required"] and not value:
             return value
 
-        if self[label]["type"] == "string":
-            value = self.parse_string(label, value)
-        elif self[label]["type"] == "datetime":
-            value = self.parse_datetime(label, value)
-        else:
-            raise exceptions.ValidationError(f'Schema type "{self[label]["type"]}" not supported.')
+        parser = self._entry_parsers[label]
+        if parser is None:
+            raise exceptions.ValidationError(
+                f'Schema type "{entry_schema["type"]}" not supported.'
+            )
 
-        return value
+        return parser(label, value)
 
     def passes_condition(self, entry_schema, data):
         if entry_schema["condition"] is None:
@@ -484,11 +648,13 @@ class Schema(collections.abc.Sequence):
         parsed = {}
         errors = Errors()
         condition_failed_labels = set()
+        condition_matchers = self._condition_matchers
         label = ""
         for entry_schema in self:
             try:
                 label = entry_schema["label"]
-                if not self.passes_condition(entry_schema, parsed):
+                matcher = condition_matchers[label]
+                if matcher is not None and not matcher(parsed):
                     condition_failed_labels.add(label)
                     continue
 
@@ -496,34 +662,88 @@ class Schema(collections.abc.Sequence):
             except exceptions.ValidationError as exc:
                 errors.add(exc, label=label)
 
-        non_extant_labels = set(data.keys()) - set(self._entry_schemas.keys())
-        if strict and non_extant_labels:
+        if strict:
+            self._add_strict_errors(data, errors, condition_failed_labels)
+
+        return FormalDict(schema=self, parsed=parsed, data=data, errors=errors)
+
+    def _add_strict_errors(self, data, errors, condition_failed_labels):
+        """
+        Add strict-mode errors for data labels that aren't present in the
+        schema or that failed their conditions
+        """
+        non_extant_labels = data.keys() - self._labels
+        if non_extant_labels:
             err_msg = 'Labels "' + ", ".join(non_extant_labels) + '" not present in schema.'
             errors.add(exceptions.ValidationError(err_msg))
 
-        condition_failed_labels = set(data.keys()) & condition_failed_labels
-        if strict and condition_failed_labels:
+        condition_failed_labels = data.keys() & condition_failed_labels
+        if condition_failed_labels:
             err_msg = (
                 'Labels "' + ", ".join(condition_failed_labels) + '" failed conditions in schema.'
             )
             errors.add(exceptions.ValidationError(err_msg))
 
-        return FormalDict(schema=self, parsed=parsed, data=data, errors=errors)
+    def parse_many(self, data_list, strict=False) -> list:
+        """
+        Parse multiple payloads of data based on the schema.
 
-    def _get_help_text(self, label):
+        Entries are iterated in the outer loop so that the per-entry state
+        resolved at schema build time (condition matchers, type parsers,
+        compiled patterns, and choice sets) is looked up once per entry
+        rather than once per payload.
+
+        Args:
+            data_list (list): The payloads to parse.
+            strict (boolean, default=False): See `Schema.parse`.
+
+        Returns:
+            A list of parsed `FormalDict` objects, one per payload, in the
+            same order as the payloads.
         """
-        Get the help text for prompted input
+        parsed_list = [{} for _ in data_list]
+        errors_list = [Errors() for _ in data_list]
+        condition_failed_list = [set() for _ in data_list]
+
+        for entry_schema in self:
+            label = entry_schema["label"]
+            matcher = self._condition_matchers[label]
+            for data, parsed, errors, condition_failed_labels in zip(
+                data_list, parsed_list, errors_list, condition_failed_list
+            ):
+                try:
+                    if matcher is not None and not matcher(parsed):
+                        condition_failed_labels.add(label)
+                        continue
+
+                    parsed[label] = self._parse_entry(label, data.get(label))
+                except exceptions.ValidationError as exc:
+                    errors.add(exc, label=label)
+
+        if strict:
+            for data, errors, condition_failed_labels in zip(
+                data_list, errors_list, condition_failed_list
+            ):
+                self._add_strict_errors(data, errors, condition_failed_labels)
+
+        return [
+            FormalDict(schema=self, parsed=parsed, data=data, errors=errors)
+            for data, parsed, errors in zip(data_list, parsed_list, errors_list)
+        ]
+
+    def _build_help_text(self, entry_schema):
+        """
+        Build the help text for prompted input
         """
-        entry_schema = self[label]
         provided_help = entry_schema["help"]
         help_text = f"<b>{provided_help}</b> " if provided_help else ""
 
         if not entry_schema["required"]:
             help_text += "<i>Optional.</i> "
 
-        if entry_schema["choices"]:
+        if entry_schema.get("choices"):
             help_text += f'<i>Choices: {entry_schema["choices"]}.</i> '
-        elif entry_schema["matches"]:
+        elif entry_schema.get("matches"):
             help_text += f'<i>Matches: {entry_schema["matches"]}.</i> '
 
         if entry_schema["multiline"]:
@@ -531,17 +751,28 @@ class Schema(collections.abc.Sequence):
 
         return help_text.strip()
 
-    def _get_prompt_text(self, label):
+    def _build_prompt_text(self, entry_schema):
         """
-        Get the prompt text
+        Build the prompt text
         """
-        entry_schema = self[label]
         prompt_text = f'{entry_schema["name"]}: '
         if entry_schema["multiline"]:
             prompt_text += "\n> "
 
         return prompt_text
 
+    def _get_help_text(self, label):
+        """
+        Get the help text for prompted input
+        """
+        return self._help_texts[label]
+
+    def _get_prompt_text(self, label):
+        """
+        Get the prompt text
+        """
+        return self._prompt_texts[label]
+
     def prompt(self, defaults=None) -> FormalDict:
         """
         Prompt for input of all entries in the schema
@@ -556,18 +787,19 @@ class Schema(collections.abc.Sequence):
         """
         defaults = defaults or {}
         data = {}
+        prompt = prompt_toolkit.prompt
 
         for entry_schema in self:
-            if not self.passes_condition(entry_schema, data):
-                continue
-
             label = entry_schema["label"]
+            matcher = self._condition_matchers[label]
+            if matcher is not None and not matcher(data):
+                continue
             choices = entry_schema.get("choices")
-            help_text = self._get_help_text(entry_schema["label"])
-            prompt_text = self._get_prompt_text(entry_schema["label"])
-            validator = _ValueValidator(schema=self, label=label)
+            help_text = self._get_help_text(label)
+            prompt_text = self._get_prompt_text(label)
+            validator = self._validators[label]
 
-            value = prompt_toolkit.prompt(
+            value = prompt(
                 prompt_text,
                 bottom_toolbar=HTML(help_text) if help_text else None,
                 completer=WordCompleter(choices) if choices else None,
@@ -3,6 +3,7 @@ Tests for the formaldict.core module
 """
 
 import datetime as dt
+import types
 from unittest import mock
 
 import kmatch
@@ -75,6 +76,11 @@ def test_formaldict(data, parsed, errors, expected_is_valid, basic_schema):
     formal_d = core.FormalDict(data=data, parsed=parsed, errors=errors_obj, schema=basic_schema)
 
     assert formal_d == parsed
+    assert formal_d == core.FormalDict(
+        data=data, parsed=parsed, errors=errors_obj, schema=basic_schema
+    )
+    assert formal_d == types.MappingProxyType(parsed)  # A non-dict mapping
+    assert formal_d != "not_a_mapping"
     assert formal_d.parsed == parsed
     assert formal_d.data == data
     assert formal_d.errors == errors_obj
@@ -341,6 +347,12 @@ def test_parse_datetime(input, expected_output):
             None,
             marks=pytest.mark.xfail(raises=exceptions.ValidationError),
         ),
+        pytest.param(  # Non-string types are also unsupported
+            [{"label": "hello", "type": 5}],
+            " 2019-01-01 ",
+            None,
+            marks=pytest.mark.xfail(raises=exceptions.ValidationError),
+        ),
     ],
 )
 def test_parse_entry(schema, input, expected_output):
@@ -412,6 +424,16 @@ def test_parse_entry(schema, input, expected_output):
             {"l1": "b"},
             'Labels "l2" failed conditions in schema.',
         ),
+        pytest.param(  # Conditions with unhashable values cannot be cached
+            [
+                {"label": "l1"},
+                {"label": "l2", "condition": ["==", "l1", {"key": "value"}]},
+            ],
+            False,
+            {"l1": "a"},
+            {"l1": "a"},
+            "",
+        ),
     ],
 )
 def test_parse(schema, strict, data, expected_output, expected_errors):
@@ -424,6 +446,35 @@ def test_parse(schema, strict, data, expected_output, expected_errors):
     assert str(parsed.errors) == expected_errors
 
 
+@pytest.mark.parametrize("strict", [True, False])
+def test_parse_many(strict):
+    """
+    Tests Schema.parse_many(), verifying each payload parses the same
+    as Schema.parse()
+    """
+    s = core.Schema(
+        [
+            {"label": "l1", "choices": ["a", "b"]},
+            {"label": "l2", "condition": ["==", "l1", "a"]},
+        ]
+    )
+    data_list = [
+        {"l1": "a", "l2": 1},
+        {"l1": "b", "l2": 1},
+        {"l1": "invalid_choice", "l2": 1},
+        {"l1": "a", "l2": 1, "additonal_label": "additonal"},
+    ]
+
+    results = s.parse_many(data_list, strict=strict)
+
+    assert len(results) == len(data_list)
+    for data, result in zip(data_list, results):
+        expected = s.parse(data, strict=strict)
+        assert result.parsed == expected.parsed
+        assert result.data == data
+        assert str(result.errors) == str(expected.errors)
+
+
 @pytest.mark.parametrize(
     "schema, expected_help_text",
     [